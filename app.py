@@ -4,8 +4,8 @@ Entry point for News Analyzer with Hindi TTS on Hugging Face Spaces
 import os
 import sys
 import logging
-import nltk
 from pathlib import Path
+from nlp_resources import ensure_nltk_resources
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,20 +31,16 @@ if is_huggingface:
     # Make sure DISPLAY is set for Selenium
     os.environ["DISPLAY"] = ":99"
 
-# Download required NLTK resources
+# Download required NLTK resources (no network calls on warm starts)
 try:
     logger.info("Setting up NLTK resources")
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    logger.info("NLTK resources downloaded successfully")
+    ensure_nltk_resources()
+    logger.info("NLTK resources available")
 except Exception as e:
     logger.warning(f"Error downloading NLTK resources: {e}")
 
 # Set up content cache directory
-cache_dir = Path("./content_cache")
-if not cache_dir.exists():
-    logger.info("Creating content cache directory")
-    cache_dir.mkdir(exist_ok=True)
+Path("./content_cache").mkdir(exist_ok=True)
 
 # Launch the main application
 logger.info("Starting News Analyzer Streamlit app")
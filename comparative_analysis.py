@@ -4,105 +4,189 @@ Comparative analysis module for News Analyzer
 
 import pandas as pd
 import numpy as np
-from collections import Counter
-import spacy
+from collections import Counter, OrderedDict
 import logging
+import re
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import matplotlib.pyplot as plt
 import io
 import base64
 from datetime import datetime
+from nlp_resources import load_spacy_model, SPACY_NER_EXCLUDE
 
 logger = logging.getLogger(__name__)
 
+# Runs of two to four capitalized words, a cheap stand-in for spaCy NER
+# (single capitalized words are mostly sentence-initial "The", "However"...).
+# Names never span a line break, so only spaces and tabs may separate the words
+_REGEX_NER = re.compile(r'\b(?:[A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+){1,3})\b')
+
+def _fast_entity_counter(text):
+    """Count capitalized names in text with a regex instead of spaCy"""
+    return Counter((name, "NAME") for name in _REGEX_NER.findall(text)
+                   if len(name) > 2)
+
 class ComparativeAnalyzer:
     """Compare multiple news articles to highlight differences and similarities"""
     
-    def __init__(self, use_spacy=True):
-        """Initialize the comparative analyzer with selected models"""
+    # Articles whose spaCy entity counts are kept (least recently used dropped first)
+    _ENTITY_CACHE_SIZE = 256
+    
+    def __init__(self, use_spacy=True, lazy_spacy=False):
+        """
+        Initialize the comparative analyzer with selected models
+        
+        Parameters:
+        - use_spacy: Load spaCy for named entity recognition
+        - lazy_spacy: Use the fast regex entity pass by default and only run
+          spaCy when a caller explicitly asks for accurate entities
+        """
         self.use_spacy = use_spacy
+        self.lazy_spacy = lazy_spacy
+        
+        # spaCy entity counts keyed by a digest of the analyzed text, so an
+        # article that is compared again is not re-parsed; the analyzer lives
+        # as long as the app process, so the cache is capped
+        self._entity_cache = OrderedDict()
+        self._entity_cache_lock = threading.Lock()
+        
+        # Similarity and key phrases may ask for the shared TF-IDF fit from
+        # different threads
+        self._tfidf_lock = threading.Lock()
         
         # Initialize NLP components
         try:
             if use_spacy:
-                try:
-                    self.nlp = spacy.load("en_core_web_sm")
-                except OSError:
-                    # Download the model if not available
-                    logger.info("Downloading spaCy model...")
-                    import spacy.cli
-                    spacy.cli.download("en_core_web_sm")
-                    self.nlp = spacy.load("en_core_web_sm")
-            
-            # TF-IDF Vectorizer for content similarity
+                self.nlp = load_spacy_model("en_core_web_sm", exclude=SPACY_NER_EXCLUDE)
+            
+            # TF-IDF Vectorizer shared by content similarity and key phrases
+            # (the 2-3 word n-grams double as the phrase vocabulary); float32
+            # halves the memory traffic of the similarity product
             self.vectorizer = TfidfVectorizer(stop_words='english', 
-                                            max_features=5000,
-                                            ngram_range=(1, 2))
+                                            max_features=8000,
+                                            ngram_range=(1, 3),
+                                            dtype=np.float32)
                 
         except Exception as e:
             logger.error(f"Error initializing comparative analyzer: {e}")
             self.use_spacy = False
     
-    def get_entity_comparison(self, articles):
+    def _prepare_articles(self, articles):
+        """
+        Collect the articles that have content once per analysis
+        Returns a dictionary shared by the individual comparison methods
+        """
+        with_content = [article for article in articles if article.get('content')]
+        return {
+            "articles": with_content,
+            "contents": [article['content'] for article in with_content]
+        }
+    
+    def _get_tfidf(self, prepared):
+        """
+        Fit the TF-IDF vectorizer once per analysis
+        Returns the document-term matrix and its feature names
+        """
+        with self._tfidf_lock:
+            if "tfidf" not in prepared:
+                tfidf_matrix = self.vectorizer.fit_transform(prepared["contents"])
+                prepared["tfidf"] = (tfidf_matrix, self.vectorizer.get_feature_names_out())
+            return prepared["tfidf"]
+    
+    def get_entity_comparison(self, articles, prepared=None, lazy_spacy=None):
         """
         Extract and compare named entities across articles
         Returns a DataFrame with entity frequencies by article
+        
+        lazy_spacy overrides the analyzer default for this call; the regex
+        pass is also used whenever spaCy is unavailable.
         """
-        if not articles or len(articles) < 2 or not self.use_spacy:
+        if not articles or len(articles) < 2:
             return None
         
+        if lazy_spacy is None:
+            lazy_spacy = self.lazy_spacy
+        
         try:
+            if prepared is None:
+                prepared = self._prepare_articles(articles)
+            
             # Extract entities from each article
             article_entities = []
-            article_titles = []
-            
-            for article in articles:
-                if not article.get('content'):
-                    continue
-                    
-                # Limit text length for performance
-                doc = self.nlp(article['content'][:10000])
+            article_titles = [article.get('title', f"Article {i+1}")
+                              for i, article in enumerate(prepared["articles"])]
+            
+            # Limit text length for performance
+            texts = [content[:10000] for content in prepared["contents"]]
+            
+            if self.use_spacy and not lazy_spacy:
+                # Only articles not seen before need to go through spaCy
+                keys = [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+                found = {}
+                with self._entity_cache_lock:
+                    for key in keys:
+                        if key in self._entity_cache:
+                            self._entity_cache.move_to_end(key)
+                            found[key] = self._entity_cache[key]
+                missing = [i for i, key in enumerate(keys) if key not in found]
+                
+                # Stream them through the pipeline in batches, longest first
+                # so each batch holds documents of similar length
+                order = sorted(missing, key=lambda i: -len(texts[i]))
+                docs = self.nlp.pipe((texts[i] for i in order), batch_size=4)
+                
+                # Count entities and their types, only including longer,
+                # more significant entities
+                for i, doc in zip(order, docs):
+                    found[keys[i]] = Counter((ent.text, ent.label_) for ent in doc.ents
+                                             if len(ent.text.strip()) > 2)
                 
-                # Extract entities and their types
-                entities = Counter()
-                for ent in doc.ents:
-                    # Only include longer, more significant entities
-                    if len(ent.text.strip()) > 2:
-                        # Use the format "text (TYPE)" for display
-                        entity_key = f"{ent.text} ({ent.label_})"
-                        entities[entity_key] += 1
+                with self._entity_cache_lock:
+                    for i in order:
+                        self._entity_cache[keys[i]] = found[keys[i]]
+                    while len(self._entity_cache) > self._ENTITY_CACHE_SIZE:
+                        self._entity_cache.popitem(last=False)
                 
-                # Keep only top entities to avoid cluttering the analysis
-                top_entities = dict(entities.most_common(15))
+                entity_counts = [found[key] for key in keys]
+            else:
+                # Fast path: capitalized names labelled as NAME
+                entity_counts = (_fast_entity_counter(text) for text in texts)
+            
+            for entities in entity_counts:
+                # Keep only top entities to avoid cluttering the analysis,
+                # using the format "text (TYPE)" for display
+                top_entities = {f"{text} ({label})": count
+                                for (text, label), count in entities.most_common(15)}
                 
                 article_entities.append(top_entities)
-                article_titles.append(article.get('title', f"Article {len(article_titles)+1}"))
             
             # Convert to DataFrame for easier comparison
             if not article_entities:
                 return None
                 
-            # Create DataFrame with entities as indices and article titles as columns
-            df = pd.DataFrame(article_entities, index=article_titles)
-            
-            # Fill NaN with 0 for proper comparison
-            df = df.fillna(0)
-            
-            # Add total count column
-            df['Total Mentions'] = df.sum(axis=0)
-            
-            # Sort by total mentions
-            df = df.sort_values('Total Mentions', axis=1, ascending=False)
-            
-            # Keep only entities mentioned in more than one article or mentioned multiple times
-            significant_columns = [col for col in df.columns if col != 'Total Mentions' and 
-                                (df[col].astype(bool).sum() > 1 or df[col].sum() > 2)]
-            significant_columns.append('Total Mentions')  # Keep the total column
-            
-            # If we have significant columns, filter the DataFrame
-            if significant_columns:
-                df = df[significant_columns]
+            # Build the article x entity count matrix directly
+            vocab = sorted({entity for entities in article_entities for entity in entities})
+            column_index = {entity: i for i, entity in enumerate(vocab)}
+            counts = np.zeros((len(article_entities), len(vocab)), dtype=np.float32)
+            for row, entities in enumerate(article_entities):
+                for entity, count in entities.items():
+                    counts[row, column_index[entity]] = count
+            
+            # Keep only entities mentioned in more than one article or mentioned
+            # multiple times, sorted by total mentions
+            totals = counts.sum(axis=0)
+            significant = ((counts > 0).sum(axis=0) > 1) | (totals > 2)
+            columns = [i for i in np.argsort(-totals, kind='stable') if significant[i]]
+            
+            # Create DataFrame with article titles as rows and entities as columns
+            df = pd.DataFrame(counts[:, columns], index=article_titles,
+                              columns=[vocab[i] for i in columns])
+            
+            # Add total count column (all entity mentions in each article)
+            df['Total Mentions'] = counts.sum(axis=1)
             
             return df
             
@@ -110,7 +194,7 @@ class ComparativeAnalyzer:
             logger.error(f"Entity comparison failed: {e}")
             return None
     
-    def get_sentiment_comparison(self, articles):
+    def get_sentiment_comparison(self, articles, prepared=None):
         """
         Compare sentiment across articles
         Returns a DataFrame with sentiment scores by article
@@ -121,24 +205,25 @@ class ComparativeAnalyzer:
         try:
             from textblob import TextBlob
             
+            if prepared is None:
+                prepared = self._prepare_articles(articles)
+            
             article_titles = []
             sentiment_data = []
             
-            for article in articles:
-                if not article.get('content'):
-                    continue
-                    
+            for article in prepared["articles"]:
                 # Get title (truncated if needed)
                 title = article.get('title', 'Untitled')
                 if len(title) > 50:
                     title = title[:47] + '...'
                 article_titles.append(title)
                 
-                # Calculate sentiment
-                analysis = TextBlob(article['content'])
+                # Calculate sentiment (TextBlob re-runs the analyzer on every
+                # .sentiment access, so read it once)
+                polarity, subjectivity = TextBlob(article['content']).sentiment
                 sentiment_data.append({
-                    'Polarity': round(analysis.sentiment.polarity, 3),
-                    'Subjectivity': round(analysis.sentiment.subjectivity, 3)
+                    'Polarity': round(polarity, 3),
+                    'Subjectivity': round(subjectivity, 3)
                 })
             
             # Create DataFrame
@@ -149,7 +234,7 @@ class ComparativeAnalyzer:
             logger.error(f"Sentiment comparison failed: {e}")
             return None
     
-    def get_content_similarity_matrix(self, articles):
+    def get_content_similarity_matrix(self, articles, prepared=None):
         """
         Calculate content similarity between articles
         Returns a similarity matrix
@@ -158,23 +243,29 @@ class ComparativeAnalyzer:
             return None
         
         try:
-            # Extract content and titles
-            contents = []
-            titles = []
+            if prepared is None:
+                prepared = self._prepare_articles(articles)
             
-            for article in articles:
-                if article.get('content'):
-                    contents.append(article['content'])
-                    titles.append(article.get('title', 'Untitled'))
+            # Extract content and titles
+            contents = prepared["contents"]
+            titles = [article.get('title', 'Untitled') for article in prepared["articles"]]
             
             if len(contents) < 2:
                 return None
                 
-            # Calculate TF-IDF
-            tfidf_matrix = self.vectorizer.fit_transform(contents)
+            # Calculate TF-IDF (reused by the key phrase comparison). Every
+            # caller gets the same vocabulary fit, so scores don't depend on
+            # whether the matrix came from a full analysis or a standalone call
+            tfidf_matrix, _ = self._get_tfidf(prepared)
             
-            # Calculate cosine similarity
-            similarity_matrix = cosine_similarity(tfidf_matrix)
+            # TF-IDF rows are already L2-normalized, so cosine similarity is a
+            # single sparse product of the matrix with its transpose
+            similarity_matrix = (tfidf_matrix @ tfidf_matrix.T).toarray()
+            
+            # Numerical cleanup of self-similarity; articles without any terms
+            # keep 0 like cosine_similarity gives them
+            non_empty = np.flatnonzero(tfidf_matrix.getnnz(axis=1))
+            similarity_matrix[non_empty, non_empty] = 1.0
             
             # Create DataFrame with article titles
             df = pd.DataFrame(similarity_matrix, index=titles, columns=titles)
@@ -185,7 +276,7 @@ class ComparativeAnalyzer:
             logger.error(f"Content similarity calculation failed: {e}")
             return None
     
-    def get_key_phrase_comparison(self, articles):
+    def get_key_phrase_comparison(self, articles, prepared=None):
         """
         Extract and compare key phrases across articles
         Returns a DataFrame with phrase frequencies by article
@@ -194,44 +285,42 @@ class ComparativeAnalyzer:
             return None
             
         try:
-            # Use TF-IDF to extract important phrases
-            article_contents = []
-            article_titles = []
+            if prepared is None:
+                prepared = self._prepare_articles(articles)
             
-            for article in articles:
-                if article.get('content'):
-                    article_contents.append(article['content'])
-                    article_titles.append(article.get('title', 'Untitled'))
+            # Use TF-IDF to extract important phrases
+            article_contents = prepared["contents"]
+            article_titles = [article.get('title', 'Untitled') for article in prepared["articles"]]
             
             if len(article_contents) < 2:
                 return None
                 
-            # Create TF-IDF vectorizer that keeps track of vocabulary
-            phrase_vectorizer = TfidfVectorizer(
-                stop_words='english',
-                ngram_range=(2, 3),  # Bi-grams and tri-grams
-                max_features=20  # Only keep top phrases
-            )
+            # Reuse the shared TF-IDF matrix and vocabulary
+            tfidf_matrix, feature_names = self._get_tfidf(prepared)
             
-            # Calculate TF-IDF
-            tfidf_matrix = phrase_vectorizer.fit_transform(article_contents)
+            # Phrases are the bi-grams and tri-grams of the vocabulary
+            phrase_mask = np.array([' ' in name for name in feature_names], dtype=bool)
+            tfidf_matrix = tfidf_matrix[:, phrase_mask]
+            feature_names = feature_names[phrase_mask]
             
-            # Get feature names (phrases)
-            feature_names = phrase_vectorizer.get_feature_names_out()
+            # Only keep top phrases by total score (in vocabulary order)
+            top_phrases = np.sort(np.asarray(tfidf_matrix.sum(axis=0)).ravel().argsort()[::-1][:20])
+            tfidf_matrix = tfidf_matrix[:, top_phrases].tocsr()
+            feature_names = feature_names[top_phrases]
             
             # Create a list to store phrase frequencies for each article
             phrase_data = []
+            indptr, indices, data = tfidf_matrix.indptr, tfidf_matrix.indices, tfidf_matrix.data
             
-            for i, article in enumerate(article_contents):
-                # Get scores for this article
-                article_scores = tfidf_matrix[i].toarray()[0]
+            for i in range(tfidf_matrix.shape[0]):
+                # Only the stored (non-zero) entries of the row matter
+                start, end = indptr[i], indptr[i + 1]
                 
                 # Create dictionary of phrase -> score
-                phrase_scores = {feature_names[j]: article_scores[j] 
-                               for j in range(len(feature_names))
-                               if article_scores[j] > 0}
+                phrase_scores = {feature_names[j]: score
+                                 for j, score in zip(indices[start:end], data[start:end])
+                                 if score > 0}
                 
-                # Sort by score and take top phrases
                 phrase_data.append(phrase_scores)
             
             # Create DataFrame
@@ -257,10 +346,21 @@ class ComparativeAnalyzer:
             logger.error(f"Key phrase comparison failed: {e}")
             return None
     
-    def generate_comparative_analysis(self, articles):
+    def _figure_to_base64(self):
+        """Render the current figure as a base64-encoded PNG and close it"""
+        buf = io.BytesIO()
+        # 72 dpi is plenty for the Streamlit view and keeps the PNGs small
+        plt.savefig(buf, format='png', dpi=72)
+        plt.close()
+        return base64.b64encode(buf.getvalue()).decode()
+    
+    def generate_comparative_analysis(self, articles, lazy_spacy=None):
         """
         Generate a comprehensive comparative analysis of articles
         Returns a dictionary with various analysis components
+        
+        Pass lazy_spacy=False to force accurate spaCy entities (or True for
+        the fast regex pass) regardless of the analyzer default.
         """
         if not articles or len(articles) < 2:
             return {
@@ -275,8 +375,28 @@ class ComparativeAnalyzer:
             "sources": [article.get('source', 'Unknown') for article in articles]
         }
         
+        # Filter the articles once and share the result with every comparison
+        prepared = self._prepare_articles(articles)
+        
+        # Fit the shared TF-IDF up front so the threads below only read
+        # from prepared and never fill it in while another reads it
+        if len(prepared["contents"]) >= 2:
+            try:
+                self._get_tfidf(prepared)
+            except Exception as e:
+                logger.error(f"TF-IDF fitting failed: {e}")
+        
+        # The four comparisons are independent, so run them side by side.
+        # Figures are drawn afterwards on this thread since pyplot keeps
+        # global state.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            entity_future = executor.submit(self.get_entity_comparison, articles, prepared, lazy_spacy)
+            sentiment_future = executor.submit(self.get_sentiment_comparison, articles, prepared)
+            similarity_future = executor.submit(self.get_content_similarity_matrix, articles, prepared)
+            phrase_future = executor.submit(self.get_key_phrase_comparison, articles, prepared)
+        
         # Entity comparison
-        entity_df = self.get_entity_comparison(articles)
+        entity_df = entity_future.result()
         if entity_df is not None and not entity_df.empty:
             # Convert to HTML for display in Streamlit
             analysis["entity_comparison"] = entity_df.to_html(classes='table table-striped')
@@ -307,19 +427,13 @@ class ComparativeAnalyzer:
                 plt.title('Entity Comparison Across Articles')
                 plt.tight_layout()
                 
-                # Save figure to a bytes buffer
-                buf = io.BytesIO()
-                plt.savefig(buf, format='png')
-                buf.seek(0)
-                
                 # Encode as base64 for HTML display
-                analysis["entity_heatmap"] = base64.b64encode(buf.read()).decode()
-                plt.close()
+                analysis["entity_heatmap"] = self._figure_to_base64()
             except Exception as e:
                 logger.error(f"Entity heatmap generation failed: {e}")
         
         # Sentiment comparison
-        sentiment_df = self.get_sentiment_comparison(articles)
+        sentiment_df = sentiment_future.result()
         if sentiment_df is not None and not sentiment_df.empty:
             analysis["sentiment_comparison"] = sentiment_df.to_html(classes='table table-striped')
             
@@ -331,19 +445,13 @@ class ComparativeAnalyzer:
                 plt.ylabel('Score (-1 to 1)')
                 plt.tight_layout()
                 
-                # Save figure to a bytes buffer
-                buf = io.BytesIO()
-                plt.savefig(buf, format='png')
-                buf.seek(0)
-                
                 # Encode as base64 for HTML display
-                analysis["sentiment_chart"] = base64.b64encode(buf.read()).decode()
-                plt.close()
+                analysis["sentiment_chart"] = self._figure_to_base64()
             except Exception as e:
                 logger.error(f"Sentiment chart generation failed: {e}")
         
         # Content similarity
-        similarity_df = self.get_content_similarity_matrix(articles)
+        similarity_df = similarity_future.result()
         if similarity_df is not None and not similarity_df.empty:
             analysis["similarity_matrix"] = similarity_df.to_html(classes='table table-striped')
             
@@ -367,26 +475,20 @@ class ComparativeAnalyzer:
                 plt.title('Content Similarity Between Articles')
                 plt.tight_layout()
                 
-                # Loop over data dimensions and create text annotations
-                for i in range(len(similarity_df.index)):
-                    for j in range(len(similarity_df.columns)):
+                # Annotate cells only while they stay readable; larger
+                # matrices rely on the colorbar
+                if len(similarity_df) <= 8:
+                    for (i, j), value in np.ndenumerate(similarity_df.values):
                         if i != j:  # Skip diagonal (self-similarity)
-                            text = ax.text(j, i, f"{similarity_df.iloc[i, j]:.2f}",
-                                        ha="center", va="center", color="black")
-                
-                # Save figure to a bytes buffer
-                buf = io.BytesIO()
-                plt.savefig(buf, format='png')
-                buf.seek(0)
+                            ax.text(j, i, f"{value:.2f}", ha="center", va="center", color="black")
                 
                 # Encode as base64 for HTML display
-                analysis["similarity_heatmap"] = base64.b64encode(buf.read()).decode()
-                plt.close()
+                analysis["similarity_heatmap"] = self._figure_to_base64()
             except Exception as e:
                 logger.error(f"Similarity heatmap generation failed: {e}")
         
         # Key phrase comparison
-        phrase_df = self.get_key_phrase_comparison(articles)
+        phrase_df = phrase_future.result()
         if phrase_df is not None and not phrase_df.empty:
             analysis["phrase_comparison"] = phrase_df.to_html(classes='table table-striped')
         
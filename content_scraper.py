@@ -6,166 +6,497 @@ import time
 import logging
 import json
 import hashlib
+import sqlite3
+import zlib
 from pathlib import Path
 from datetime import datetime, timedelta
 import random
+import functools
+import threading
+import atexit
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 import re
 
 # Configure logging
 logger = logging.getLogger("ContentScraper")
 
+# Patterns used for every scraped page, compiled once
+_TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title>', re.IGNORECASE)
+_HEAD_END_RE = re.compile(rb'</head\s*>', re.IGNORECASE)
+_BODY_STRAINER = SoupStrainer('body')
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_SENTENCE_SPLIT_RE = re.compile(r'(?:\n\n|\.\s+)')
+_LINE_RE = re.compile(r'[^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]+')  # Same breaks as str.splitlines
+
+def _default_parser():
+    """Prefer the lxml C parser (several times faster); fall back to html.parser"""
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        logger.warning("lxml not installed, falling back to html.parser")
+        return "html.parser"
+
+def _close_at_exit(scraper_ref):
+    """Close a scraper at interpreter exit if it is still alive"""
+    scraper = scraper_ref()
+    if scraper is not None:
+        scraper.close()
+
 class ContentScraper:
     """Scrapes content from various news sources with optimized performance"""
     
-    def __init__(self, use_selenium=False, cache_dir="./content_cache", cache_duration_days=1):
+    # Common article containers, most specific first
+    _ARTICLE_SELECTORS = (
+        "article", "[itemprop='articleBody']", ".article-content",
+        ".article-body", ".story-body", ".post-content", ".content",
+        "#content", ".main-content", ".entry-content"
+    )
+    
+    # Matches any of the article containers in a single query
+    _ARTICLE_SELECTOR_UNION = ", ".join(_ARTICLE_SELECTORS)
+    
+    # Selector combinations tried by extract_from_multiple_selectors
+    _SELECTOR_GROUPS = (
+        # Main article containers
+        ('article', '[itemprop="articleBody"]', '.article-content', '.article-body'),
+        
+        # Content wrappers
+        ('.content', '.story-body', '.post-content', '.page-content', '.entry-content'),
+        
+        # More specific selectors
+        ('.main-content', '.story', '.article__body', '.article-text', '.story-text'),
+        
+        # Very specific selectors for common sites
+        ('.story__body', '.article__content', '.entry__body', '.c-entry-content', '.post__content')
+    )
+    
+    # Article text is near the top of the page; anything past this is not downloaded
+    _MAX_BODY_BYTES = 2 * 1024 * 1024
+    
+    # In-page scripts for the Selenium path: container text lengths for a list
+    # of selectors (0 when missing or too short), and paragraph texts over 30 chars
+    _SELECTOR_TEXT_LENGTHS_JS = (
+        "return arguments[0].map(function (s) {"
+        " var el = document.querySelector(s);"
+        " var n = el ? el.innerText.length : 0;"
+        " return n > 200 ? n : 0; });"
+    )
+    _PARAGRAPH_TEXTS_JS = (
+        "return Array.prototype.map.call(document.getElementsByTagName('p'),"
+        " function (p) { return p.innerText.trim(); })"
+        ".filter(function (t) { return t.length > 30; });"
+    )
+    
+    # Expired cache entries with an ETag or Last-Modified are kept this long
+    # so they can be revalidated with a conditional request
+    _REVALIDATE_DAYS = 7
+    
+    # First byte of a zlib-compressed cache entry; entries stored as plain
+    # JSON text (before compression was added) have no flag
+    _CACHE_ZLIB_FLAG = b'\x01'
+    
+    # Elements whose content never belongs in article text
+    _NON_TEXT_TAGS = ['script', 'style', 'noscript', 'svg', 'iframe']
+    
+    # How far into a page (in bytes) to look for <title> before scanning all of it
+    _TITLE_SCAN_BYTES = 8192
+    
+    # How much of a page without a closing </head> to parse when looking for og:title
+    _HEAD_FALLBACK_BYTES = 16384
+    
+    # A domain where only Selenium worked goes straight to Selenium until it
+    # misses this many times in a row
+    _SELENIUM_FIRST_MAX_MISSES = 2
+    
+    # Resources the WebDriver never needs to download for text extraction
+    _BLOCKED_URL_PATTERNS = (
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+        '*.woff', '*.woff2', '*.ttf', '*.mp4', '*.webm', '*.mp3',
+        '*doubleclick*', '*googlesyndication*', '*google-analytics*'
+    )
+    
+    # The extract_from_multiple_selectors selectors compiled once, for matching against parsed pages
+    _GROUP_SELECTORS = tuple(selector for group in _SELECTOR_GROUPS for selector in group)
+    _COMPILED_GROUP_SELECTORS = tuple(soupsieve.compile(selector) for selector in _GROUP_SELECTORS)
+    
+    # The same selectors as one compound selector, matched in a single tree walk
+    _GROUP_SELECTOR_UNION = soupsieve.compile(", ".join(_GROUP_SELECTORS))
+    
+    # Article containers by domain, tried in order; the paragraphs of the
+    # first one found are the article (subdomains match too)
+    _SITE_SELECTORS = {
+        'reuters.com': ('[data-testid="article-body"]', '.article-body__content__17Yit', '.StandardArticleBody_body'),
+        'apnews.com': ('.Article', 'article', '.RichTextStoryBody'),
+        'theguardian.com': ('.content__article-body', 'article'),
+        'aljazeera.com': ('.wysiwyg--all-content', 'article'),
+        'cnbc.com': ('.ArticleBody-articleBody', 'article'),
+        'usatoday.com': ('.gnt_ar_b', 'article'),
+        'news.yahoo.com': ('.caas-body', 'article'),
+        'foxnews.com': ('.article-body', 'article'),
+        'hindustantimes.com': ('.storyDetails', 'article'),
+        'ndtv.com': ('.sp-cn', 'article'),
+        'thehindu.com': ('.article', '.story-content'),
+        'economictimes.indiatimes.com': ('.artText', '.article-body')
+    }
+    _COMPILED_SITE_SELECTORS = {
+        site: tuple(soupsieve.compile(selector) for selector in selectors)
+        for site, selectors in _SITE_SELECTORS.items()
+    }
+    
+    # Sites whose pages need more than a container lookup
+    _SITE_EXTRACTORS = {
+        'bbc.com': '_extract_bbc',
+        'bbc.co.uk': '_extract_bbc',
+        'npr.org': '_extract_npr',
+        'nytimes.com': '_extract_nytimes',
+        'washingtonpost.com': '_extract_wapo',
+        'cnn.com': '_extract_cnn',
+        'timesofindia.indiatimes.com': '_extract_toi'
+    }
+    
+    # Phrases that suggest the article is behind a paywall
+    _PAYWALL_INDICATORS = (
+        'subscribe now', 'subscription required', 'premium content',
+        'to continue reading', 'create an account', 'sign up to read',
+        'subscribe to read', 'premium subscriber'
+    )
+    
+    # All paywall phrases in one case-insensitive pattern, so a page is scanned
+    # once (run on the raw page bytes)
+    _PAYWALL_RE = re.compile(
+        '|'.join(r'\s+'.join(map(re.escape, indicator.split())) for indicator in _PAYWALL_INDICATORS).encode(),
+        re.IGNORECASE
+    )
+    
+    def __init__(self, use_selenium=False, cache_dir="./content_cache", cache_duration_days=1, store_html=False):
         """Initialize the content scraper with optimized defaults"""
         self.use_selenium = use_selenium  # Default to False for better performance
+        self.store_html = store_html  # Keep page HTML in Selenium results (never cached)
         self.cache_dir = Path(cache_dir)
         self.cache_duration_days = cache_duration_days
-        self.cache = {}
+        self._db = None
+        self._cache_lock = threading.Lock()  # Articles may be scraped from several threads
         self.driver = None
+        self._driver_lock = threading.Lock()  # The WebDriver is not thread-safe
+        self._driver_page_count = 0
+        self.driver_max_pages = 50  # Restart Chrome after this many pages to keep memory in check
+        self._selenium_domains = {}  # domain -> Selenium-first misses since it last worked there (persisted)
+        self._selenium_domains_lock = threading.Lock()
         self.timeout = 10  # Reduced timeout for faster failures
-        self._load_cache()
+        self._open_cache()
         
         # Initialize BeautifulSoup parser once
-        self.parser = "html.parser"  # Lighter than lxml
+        self.parser = _default_parser()
         
         # Common headers to simulate a real browser
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': ACCEPT_ENCODING,  # gzip/deflate, plus br/zstd when their decoders are installed
             'Connection': 'keep-alive',
         }
         
-    def __del__(self):
-        """Clean up resources"""
+        # Pooled session so repeated fetches reuse connections
+        self._session = self._create_session()
+        
+        # Make sure Chrome is not left running if close() is never called
+        atexit.register(_close_at_exit, weakref.ref(self))
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Release the WebDriver, HTTP session and cache connection (safe to call more than once)"""
+        if getattr(self, '_driver_lock', None):
+            with self._driver_lock:
+                self._quit_driver()
+        
+        session = getattr(self, '_session', None)
+        if session is not None:
+            self._session = None
+            try:
+                session.close()
+            except Exception as e:
+                logger.debug("Failed to close HTTP session: %s", e)
+        
+        if getattr(self, '_cache_lock', None):
+            with self._cache_lock:
+                if self._db is not None:
+                    try:
+                        self._db.close()
+                    except Exception as e:
+                        logger.debug("Failed to close cache database: %s", e)
+                    self._db = None
+    
+    def _quit_driver(self):
+        """Shut down the WebDriver so the next Selenium call starts a fresh one"""
         if self.driver:
             try:
                 self.driver.quit()
-            except:
-                pass
+            except Exception as e:
+                logger.warning("Failed to quit WebDriver: %s", e)
+        self.driver = None
+        self._driver_page_count = 0
     
-    def _load_cache(self):
-        """Load the cache from disk"""
+    def _create_session(self):
+        """Create a requests session with connection pooling and retries on server errors"""
+        session = requests.Session()
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False  # Hand the last response back so the status check still applies
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self.headers)
+        return session
+    
+    def _open_cache(self):
+        """Open the SQLite cache on disk, importing a legacy cache.json once"""
         try:
             if not self.cache_dir.exists():
                 self.cache_dir.mkdir(parents=True)
             
-            cache_file = self.cache_dir / "cache.json"
-            if cache_file.exists():
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    self.cache = json.load(f)
-                logger.info(f"Loaded {len(self.cache)} cached items from disk")
+            # Autocommit mode: every insert is its own small write
+            self._db = sqlite3.connect(
+                str(self.cache_dir / "cache.db"),
+                isolation_level=None,
+                check_same_thread=False  # Shared across scraping threads behind _cache_lock
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, url TEXT, content TEXT, ts TEXT, "
+                "etag TEXT, last_modified TEXT)"
+            )
+            
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS selenium_domains (domain TEXT PRIMARY KEY, misses INTEGER)"
+            )
+            self._selenium_domains = dict(self._db.execute("SELECT domain, misses FROM selenium_domains"))
+            
+            # Caches created before validators were stored lack the last two columns
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(cache)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:
+                    self._db.execute(f"ALTER TABLE cache ADD COLUMN {column} TEXT")
+            
+            legacy_file = self.cache_dir / "cache.json"
+            if legacy_file.exists():
+                with open(legacy_file, "r", encoding="utf-8") as f:
+                    legacy_cache = json.load(f)
+                rows = [(key, entry["url"], json.dumps(entry["content"], ensure_ascii=False), entry["timestamp"])
+                        for key, entry in legacy_cache.items()]
+                self._db.execute("BEGIN")
+                self._db.executemany("INSERT OR REPLACE INTO cache (key, url, content, ts) VALUES (?, ?, ?, ?)", rows)
+                self._db.execute("COMMIT")
+                legacy_file.rename(legacy_file.with_suffix(".json.imported"))
+                logger.info(f"Imported {len(rows)} cached items from cache.json")
+            
+            self._prune_cache()
+        except Exception as e:
+            logger.error(f"Failed to open cache: {e}")
+            self._db = None
+    
+    def _prune_cache(self):
+        """
+        Delete cache entries that can no longer be used: expired entries
+        without HTTP validators, and any entry past the revalidation window
+        """
+        now = datetime.now()
+        expired = (now - timedelta(days=self.cache_duration_days)).isoformat()
+        stale = (now - timedelta(days=max(self.cache_duration_days, self._REVALIDATE_DAYS))).isoformat()
+        with self._cache_lock:
+            deleted = self._db.execute(
+                "DELETE FROM cache WHERE ts < ? AND ((etag IS NULL AND last_modified IS NULL) OR ts < ?)",
+                (expired, stale)
+            ).rowcount
+        if deleted:
+            logger.info(f"Pruned {deleted} expired cache entries")
+    
+    def cache_size(self):
+        """Return the number of cached articles"""
+        if self._db is None:
+            return 0
+        try:
+            with self._cache_lock:
+                return self._db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
         except Exception as e:
-            logger.error(f"Failed to load cache: {e}")
-            self.cache = {}
+            logger.error(f"Failed to count cached items: {e}")
+            return 0
     
-    def _save_cache(self):
-        """Save the cache to disk"""
+    def clear_cache(self):
+        """Remove all cached articles"""
+        if self._db is None:
+            return
         try:
-            cache_file = self.cache_dir / "cache.json"
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, ensure_ascii=False)
-            logger.info(f"Saved {len(self.cache)} cached items to disk")
+            with self._cache_lock:
+                self._db.execute("DELETE FROM cache")
+            logger.info("Cleared content cache")
         except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
+            logger.error(f"Failed to clear cache: {e}")
+    
+    @staticmethod
+    def _cache_key(url):
+        """Cache key for a URL (non-cryptographic use, so the fast blake2b is enough)"""
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    
+    def _get_cache_row(self, url):
+        """Get the raw cache row (content, ts, etag, last_modified) for a URL, expired or not"""
+        if self._db is None:
+            return None
+        
+        key = self._cache_key(url)
+        legacy_key = hashlib.md5(url.encode()).hexdigest()  # Entries written before the switch to blake2b
+        
+        try:
+            with self._cache_lock:
+                return self._db.execute(
+                    "SELECT content, ts, etag, last_modified FROM cache WHERE key IN (?, ?) "
+                    "ORDER BY ts DESC LIMIT 1",
+                    (key, legacy_key)
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Failed to read cache: {e}")
+            return None
+    
+    @classmethod
+    def _encode_cache_entry(cls, article):
+        """Serialize an article for the cache as a flagged, zlib-compressed JSON blob"""
+        data = json.dumps(article, ensure_ascii=False).encode('utf-8')
+        return sqlite3.Binary(cls._CACHE_ZLIB_FLAG + zlib.compress(data))
+    
+    @classmethod
+    def _decode_cache_entry(cls, stored):
+        """Deserialize a cached article, compressed or legacy plain JSON text"""
+        if isinstance(stored, bytes) and stored[:1] == cls._CACHE_ZLIB_FLAG:
+            return json.loads(zlib.decompress(stored[1:]))
+        return json.loads(stored)
     
     def _get_cached_content(self, url):
         """Get cached content for a URL"""
-        key = hashlib.md5(url.encode()).hexdigest()
+        row = self._get_cache_row(url)
         
-        if key in self.cache:
-            cache_entry = self.cache[key]
-            cache_time = datetime.fromisoformat(cache_entry["timestamp"])
+        if row:
+            content, ts = row[0], row[1]
+            cache_time = datetime.fromisoformat(ts)
             if datetime.now() - cache_time < timedelta(days=self.cache_duration_days):
-                logger.info(f"Using cached content for {url}")
-                return cache_entry["content"]
+                logger.info("Using cached content for %s", url)
+                return self._decode_cache_entry(content)
         
         return None
     
+    def _get_cache_validators(self, url):
+        """
+        Get the HTTP validators stored for a URL, even if its entry expired
+        Returns (content, etag, last_modified), or None if there is nothing to revalidate
+        """
+        row = self._get_cache_row(url)
+        if not row or not (row[2] or row[3]):
+            return None
+        return self._decode_cache_entry(row[0]), row[2], row[3]
+    
     def _cache_content(self, url, content):
-        """Cache content for a URL"""
-        key = hashlib.md5(url.encode()).hexdigest()
-        self.cache[key] = {
-            "url": url,
-            "content": content,
-            "timestamp": datetime.now().isoformat()
-        }
-        # Don't save cache immediately - will be saved periodically
+        """
+        Cache content for a URL
+        
+        'etag' and 'last_modified' keys in content are stored as validators
+        for conditional requests rather than as part of the article; page
+        HTML is never cached.
+        """
+        if self._db is None:
+            return
+        
+        key = self._cache_key(url)
+        article = {k: v for k, v in content.items() if k not in ('etag', 'last_modified', 'html')}
+        article['html'] = None
+        try:
+            with self._cache_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache (key, url, content, ts, etag, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, url, self._encode_cache_entry(article), datetime.now().isoformat(),
+                     content.get('etag'), content.get('last_modified'))
+                )
+        except Exception as e:
+            logger.error(f"Failed to cache content: {e}")
     
-    def _extract_domain(self, url):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_domain(url):
         """Extract the domain from a URL (optimized)"""
         try:
             domain = urlparse(url).netloc
             return domain
-        except:
+        except Exception as e:
+            logger.debug("Failed to parse URL %s: %s", url, e)
             # Fallback if parsing fails
             if "://" in url:
                 domain = url.split("://")[1].split("/")[0]
                 return domain
             return url.split("/")[0]
 
-    def _get_site_specific_extractor(self, domain):
-        """Get site-specific extraction function based on domain"""
-        extractors = {
-            'reuters.com': self._extract_reuters,
-            'apnews.com': self._extract_ap,
-            'bbc.com': self._extract_bbc,
-            'bbc.co.uk': self._extract_bbc,
-            'npr.org': self._extract_npr,
-            'theguardian.com': self._extract_guardian,
-            'aljazeera.com': self._extract_aljazeera,
-            'cnbc.com': self._extract_cnbc,
-            'usatoday.com': self._extract_usatoday,
-            'nytimes.com': self._extract_nytimes,
-            'washingtonpost.com': self._extract_wapo,
-            'news.yahoo.com': self._extract_yahoo,
-            'cnn.com': self._extract_cnn,
-            'foxnews.com': self._extract_fox,
-            'hindustantimes.com': self._extract_hindustan_times,
-            'ndtv.com': self._extract_ndtv,
-            'timesofindia.indiatimes.com': self._extract_toi,
-            'thehindu.com': self._extract_the_hindu,
-            'economictimes.indiatimes.com': self._extract_economic_times
-        }
-        
-        for site_domain, extractor in extractors.items():
-            if site_domain in domain:
-                return extractor
+    @staticmethod
+    def _join_paragraphs(paragraphs, min_length=20):
+        """Join the stripped text of paragraphs longer than min_length characters"""
+        texts = (p.get_text().strip() for p in paragraphs)
+        return '\n\n'.join(text for text in texts if len(text) > min_length)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _lookup_site(cls, domain):
+        """
+        Find how to extract articles from a domain
+        Returns (extractor method name, None), (None, compiled selectors) or None
+        """
+        # Look up the host and each parent domain, e.g. edition.cnn.com -> cnn.com
+        labels = domain.lower().split(':')[0].split('.')
+        for i in range(len(labels) - 1):
+            site = '.'.join(labels[i:])
+            extractor_name = cls._SITE_EXTRACTORS.get(site)
+            if extractor_name:
+                return extractor_name, None
+            selectors = cls._COMPILED_SITE_SELECTORS.get(site)
+            if selectors:
+                return None, selectors
         
         return None
     
-    def _extract_reuters(self, soup):
-        """Extract content from Reuters articles"""
-        # Try multiple selectors for Reuters articles
-        content_div = soup.select_one('[data-testid="article-body"]')
-        if not content_div:
-            content_div = soup.select_one('.article-body__content__17Yit')
-        if not content_div:
-            content_div = soup.select_one('.StandardArticleBody_body')
+    def _get_site_specific_extractor(self, domain):
+        """Get site-specific extraction function based on domain"""
+        site = self._lookup_site(domain)
+        if not site:
+            return None
         
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
+        extractor_name, selectors = site
+        if extractor_name:
+            return getattr(self, extractor_name)
+        return functools.partial(self._extract_site, selectors=selectors)
     
-    def _extract_ap(self, soup):
-        """Extract content from AP News articles"""
-        content_div = soup.select_one('.Article')
-        if not content_div:
-            content_div = soup.select_one('article')
-        if not content_div:
-            content_div = soup.select_one('.RichTextStoryBody')
-        
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
+    def _extract_site(self, soup, selectors):
+        """Extract the paragraphs of the first matching article container"""
+        for selector in selectors:
+            content_div = selector.select_one(soup)
+            if content_div:
+                return self._join_paragraphs(content_div.find_all('p'))
         return ""
     
     def _extract_bbc(self, soup):
@@ -181,7 +512,7 @@ class ContentScraper:
             if not paragraphs:
                 paragraphs = article_body.find_all('p')
                 
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
+            content = self._join_paragraphs(paragraphs)
             return content
         return ""
     
@@ -195,55 +526,7 @@ class ContentScraper:
                 content_div = article
                 
             paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
-    
-    def _extract_guardian(self, soup):
-        """Extract content from The Guardian articles"""
-        content_div = soup.select_one('.content__article-body')
-        if not content_div:
-            content_div = soup.select_one('article')
-            
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
-    
-    def _extract_aljazeera(self, soup):
-        """Extract content from Al Jazeera articles"""
-        content_div = soup.select_one('.wysiwyg--all-content')
-        if not content_div:
-            content_div = soup.select_one('article')
-            
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
-    
-    def _extract_cnbc(self, soup):
-        """Extract content from CNBC articles"""
-        article_body = soup.select_one('.ArticleBody-articleBody')
-        if not article_body:
-            article_body = soup.select_one('article')
-            
-        if article_body:
-            paragraphs = article_body.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
-    
-    def _extract_usatoday(self, soup):
-        """Extract content from USA Today articles"""
-        content_div = soup.select_one('.gnt_ar_b')
-        if not content_div:
-            content_div = soup.select_one('article')
-            
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
+            content = self._join_paragraphs(paragraphs)
             return content
         return ""
     
@@ -257,7 +540,7 @@ class ContentScraper:
                 # Try to at least get the first paragraph/summary
                 initial_paras = content_div.select('p:nth-child(-n+3)')
                 if initial_paras:
-                    content = '\n\n'.join([p.get_text().strip() for p in initial_paras if len(p.get_text()) > 20])
+                    content = self._join_paragraphs(initial_paras)
                     content += "\n\n[Article continues behind paywall]"
                     return content
                 return "Article behind paywall"
@@ -266,7 +549,7 @@ class ContentScraper:
             if not paragraphs:
                 paragraphs = content_div.find_all('p')
                 
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
+            content = self._join_paragraphs(paragraphs)
             return content
         return ""
     
@@ -283,19 +566,7 @@ class ContentScraper:
             if not paragraphs:
                 paragraphs = content_div.find_all('p')
                 
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
-    
-    def _extract_yahoo(self, soup):
-        """Extract content from Yahoo News articles"""
-        content_div = soup.select_one('.caas-body')
-        if not content_div:
-            content_div = soup.select_one('article')
-            
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
+            content = self._join_paragraphs(paragraphs)
             return content
         return ""
     
@@ -307,47 +578,11 @@ class ContentScraper:
             
         if content_div:
             paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
+            content = self._join_paragraphs(paragraphs)
             return content
         elif soup.select('.zn-body__paragraph'):  # Alternative CNN format
             paragraphs = soup.select('.zn-body__paragraph')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
-    
-    def _extract_fox(self, soup):
-        """Extract content from Fox News articles"""
-        article_body = soup.select_one('.article-body')
-        if not article_body:
-            article_body = soup.select_one('article')
-            
-        if article_body:
-            paragraphs = article_body.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
-    
-    def _extract_hindustan_times(self, soup):
-        """Extract content from Hindustan Times articles"""
-        content_div = soup.select_one('.storyDetails')
-        if not content_div:
-            content_div = soup.select_one('article')
-            
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
-    
-    def _extract_ndtv(self, soup):
-        """Extract content from NDTV articles"""
-        content_div = soup.select_one('.sp-cn')
-        if not content_div:
-            content_div = soup.select_one('article')
-            
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
+            content = self._join_paragraphs(paragraphs)
             return content
         return ""
     
@@ -364,38 +599,40 @@ class ContentScraper:
             if not paragraphs:  # TOI sometimes doesn't use paragraph tags
                 content = content_div.get_text().strip()
                 # Clean up content
-                content = re.sub(r'\s+', ' ', content)
+                content = _WHITESPACE_RE.sub(' ', content)
                 # Split into paragraphs by double linebreaks or sentences
-                content = '\n\n'.join([p.strip() for p in re.split(r'(?:\n\n|\.\s+)', content) if len(p.strip()) > 20])
+                content = '\n\n'.join([p.strip() for p in _SENTENCE_SPLIT_RE.split(content) if len(p.strip()) > 20])
                 return content
                 
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
+            content = self._join_paragraphs(paragraphs)
             return content
         return ""
     
-    def _extract_the_hindu(self, soup):
-        """Extract content from The Hindu articles"""
-        content_div = soup.select_one('.article')
-        if not content_div:
-            content_div = soup.select_one('.story-content')
-            
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
-    
-    def _extract_economic_times(self, soup):
-        """Extract content from Economic Times articles"""
-        content_div = soup.select_one('.artText')
-        if not content_div:
-            content_div = soup.select_one('.article-body')
-            
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-            return content
-        return ""
+    @staticmethod
+    def _first_matches(soup, union, selectors):
+        """
+        Find what select_one would return for each selector, with a single tree walk
+        
+        Parameters:
+        - soup: Parsed page
+        - union: The selectors compiled as one compound selector
+        - selectors: The individually compiled selectors, in priority order
+        
+        Returns:
+        - List of matched elements in selector priority order
+        """
+        first_matches = {}
+        try:
+            for element in union.select(soup):
+                for index, selector in enumerate(selectors):
+                    if index not in first_matches and selector.match(element):
+                        first_matches[index] = element
+                if len(first_matches) == len(selectors):
+                    break
+        except Exception as e:
+            logger.debug("Selector matching failed: %s", e)
+        
+        return [first_matches[index] for index in sorted(first_matches)]
     
     def extract_from_multiple_selectors(self, soup):
         """
@@ -404,44 +641,26 @@ class ContentScraper:
         """
         best_content = ""
         
-        # Various selector combinations to try
-        selector_groups = [
-            # Main article containers
-            ['article', '[itemprop="articleBody"]', '.article-content', '.article-body'],
-            
-            # Content wrappers
-            ['.content', '.story-body', '.post-content', '.page-content', '.entry-content'],
-            
-            # More specific selectors
-            ['.main-content', '.story', '.article__body', '.article-text', '.story-text'],
-            
-            # Very specific selectors for common sites
-            ['.story__body', '.article__content', '.entry__body', '.c-entry-content', '.post__content']
-        ]
-        
-        # Try each selector group
-        for selectors in selector_groups:
-            for selector in selectors:
-                try:
-                    element = soup.select_one(selector)
-                    if element:
-                        # Try to get paragraphs within this container
-                        paragraphs = element.find_all('p')
-                        if paragraphs:
-                            content = "\n\n".join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 20])
-                            if len(content) > len(best_content):
-                                best_content = content
-                        
-                        # If no paragraphs or content still too short, get all text
-                        if len(best_content) < 200:
-                            content = element.get_text().strip()
-                            # Clean up content (remove extra whitespace)
-                            content = re.sub(r'\s+', ' ', content)
-                            content = re.sub(r'\n\s*\n', '\n\n', content)
-                            if len(content) > len(best_content):
-                                best_content = content
-                except Exception as e:
-                    continue
+        # Try the containers in selector priority order
+        for element in self._first_matches(soup, self._GROUP_SELECTOR_UNION, self._COMPILED_GROUP_SELECTORS):
+            try:
+                # Try to get paragraphs within this container
+                paragraphs = element.find_all('p')
+                if paragraphs:
+                    content = self._join_paragraphs(paragraphs)
+                    if len(content) > len(best_content):
+                        best_content = content
+                
+                # If no paragraphs or content still too short, get all text
+                if len(best_content) < 200:
+                    content = element.get_text().strip()
+                    # Clean up content (remove extra whitespace)
+                    content = _WHITESPACE_RE.sub(' ', content)
+                    content = _BLANK_LINES_RE.sub('\n\n', content)
+                    if len(content) > len(best_content):
+                        best_content = content
+            except Exception as e:
+                continue
         
         return best_content
 
@@ -471,11 +690,15 @@ class ContentScraper:
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
             
             # Disable images for performance
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
             chrome_options.add_experimental_option("prefs", {
                 "profile.default_content_settings": {"images": 2},
                 "profile.managed_default_content_settings": {"images": 2}
             })
             
+            # Return from driver.get() at DOMContentLoaded rather than the full load event
+            chrome_options.page_load_strategy = "eager"
+            
             # Determine environment (Hugging Face Spaces vs local)
             is_huggingface = os.environ.get('SPACE_ID') is not None
             
@@ -484,13 +707,24 @@ class ContentScraper:
                 chrome_options.binary_location = "/usr/bin/chromium-browser"
                 service = Service("/usr/bin/chromedriver")
             else:
-                # For local development, use webdriver-manager
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
+                # For local development, use webdriver-manager when it is installed;
+                # otherwise Selenium Manager locates a matching chromedriver
+                try:
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    service = Service(ChromeDriverManager().install())
+                except ImportError:
+                    logger.info("webdriver-manager not installed, letting Selenium locate chromedriver")
+                    service = Service()
             
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.set_page_load_timeout(self.timeout)
             
+            # Block media, fonts and ad trackers at the network level
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                "urls": list(self._BLOCKED_URL_PATTERNS)
+            })
+            
             # Execute stealth JS to avoid detection
             self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
                 "userAgent": self.headers['User-Agent']
@@ -508,52 +742,83 @@ class ContentScraper:
     
     def _scrape_with_selenium(self, url):
         """Scrape content using Selenium (only called if use_selenium=True)"""
+        # Callers share one warm WebDriver, one page at a time
+        with self._driver_lock:
+            try:
+                return self._scrape_with_driver(url)
+            finally:
+                if self.driver is not None:
+                    self._driver_page_count += 1
+                    if self._driver_page_count >= self.driver_max_pages:
+                        logger.info(f"Restarting WebDriver after {self._driver_page_count} pages")
+                        self._quit_driver()
+    
+    def _scrape_with_driver(self, url):
+        """Load a page in the shared WebDriver and extract its content"""
         driver = self._initialize_selenium()
         if not driver:
             return None
         
         try:
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+            from selenium.common.exceptions import TimeoutException
+            
             driver.get(url)
             
-            # Give the page minimal time to load
-            time.sleep(2)
+            # Wait until an article container shows up instead of sleeping for
+            # a fixed time, then give plain paragraphs a short extra chance
+            try:
+                WebDriverWait(driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self._ARTICLE_SELECTOR_UNION))
+                )
+            except TimeoutException:
+                try:
+                    WebDriverWait(driver, 2).until(EC.presence_of_element_located((By.TAG_NAME, "p")))
+                except TimeoutException:
+                    logger.debug("No article content appeared for %s, extracting anyway", url)
             
-            # Try to extract content using selectors
-            selectors = [
-                "article", "[itemprop='articleBody']", ".article-content", 
-                ".article-body", ".story-body", ".post-content", ".content",
-                "#content", ".main-content", ".entry-content"
-            ]
+            # Measure the text of every candidate container in one round-trip,
+            # so only a container long enough to be the article is transferred
+            try:
+                text_lengths = driver.execute_script(self._SELECTOR_TEXT_LENGTHS_JS, list(self._ARTICLE_SELECTORS))
+            except Exception as e:
+                logger.debug("Could not measure containers for %s: %s", url, e)
+                text_lengths = [1] * len(self._ARTICLE_SELECTORS)  # Check every selector below
             
-            for selector in selectors:
+            # Try to extract content using selectors
+            css_selector = By.CSS_SELECTOR
+            for selector, text_length in zip(self._ARTICLE_SELECTORS, text_lengths):
+                if not text_length:
+                    continue
                 try:
-                    from selenium.webdriver.common.by import By
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                    elements = driver.find_elements(css_selector, selector)
                     if elements:
                         article_text = elements[0].text
                         if len(article_text) > 200:  # Meaningful content
                             return {
                                 'title': driver.title,
                                 'content': article_text,
-                                'html': driver.page_source[:20000]  # Limit HTML size
+                                'html': driver.page_source[:20000] if self.store_html else None  # Limit HTML size
                             }
-                except:
+                except Exception as e:
+                    logger.debug("Selector %s failed for %s: %s", selector, url, e)
                     continue
             
-            # Extract paragraphs as a fallback
+            # Extract paragraphs as a fallback, filtered inside the page
             try:
-                from selenium.webdriver.common.by import By
-                paragraphs = driver.find_elements(By.TAG_NAME, "p")
+                paragraphs = driver.execute_script(self._PARAGRAPH_TEXTS_JS)
                 if paragraphs:
-                    content = "\n\n".join([p.text for p in paragraphs if len(p.text) > 30])
+                    content = "\n\n".join(paragraphs)
                     if content and len(content) > 200:
                         return {
                             'title': driver.title,
                             'content': content,
-                            'html': driver.page_source[:20000]
+                            'html': driver.page_source[:20000] if self.store_html else None
                         }
-            except:
-                pass
+            except Exception as e:
+                logger.debug("Paragraph extraction failed for %s: %s", url, e)
             
             # Return None to fall back to requests method
             return None
@@ -562,17 +827,30 @@ class ContentScraper:
             logger.error(f"Selenium scraping failed: {e}")
             return None
     
-    def scrape_with_enhanced_fallbacks(self, url):
+    def scrape_with_enhanced_fallbacks(self, url, page=None):
         """
         Enhanced scraping that tries multiple methods to extract content
+        
+        page is an already downloaded (raw bytes, charset) pair for url;
+        without it the page is fetched again
         """
         try:
-            # First try standard request
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            if response.status_code != 200:
+            if page is None:
+                # First try standard request (the session supplies the headers)
+                response = self._session.get(url, timeout=self.timeout, stream=True)
+                try:
+                    if response.status_code != 200:
+                        return None
+                    page = self._read_html(response)
+                finally:
+                    response.close()
+            
+            if page is None:
                 return None
-                
-            soup = BeautifulSoup(response.text, self.parser)
+            body, charset = page
+            
+            # Parse a fresh tree: the first pass decomposes elements from its own
+            soup = self._make_soup(body, charset)
             
             # Try site-specific extractor first
             domain = self._extract_domain(url)
@@ -593,7 +871,7 @@ class ContentScraper:
                 
             # If we've found substantial content
             if content and len(content) > 300:
-                title = self._extract_title_from_html(response.text)
+                title = self._extract_title_from_html(body, soup.original_encoding or charset)
                 return {
                     'title': title,
                     'content': content,
@@ -606,8 +884,17 @@ class ContentScraper:
             logger.error(f"Enhanced scraping failed: {e}")
             return None
     
-    def _scrape_with_requests(self, url):
-        """Simple requests-based scraper (primary method)"""
+    def _scrape_with_requests(self, url, conditional=True, fetch=None):
+        """
+        Simple requests-based scraper (primary method)
+        conditional=False skips revalidating an expired cache entry
+        
+        If a fetch dict is given it receives the HTTP 'status' and the
+        downloaded 'page' (raw bytes, charset; None if not HTML), also when
+        scraping fails, so the enhanced fallback can reuse or skip the fetch
+        """
+        if fetch is None:
+            fetch = {}
         try:
             # Add random sleep to avoid rate limiting
             time.sleep(random.uniform(0.1, 0.3))
@@ -622,77 +909,87 @@ class ContentScraper:
             elif 'wsj.com' in domain:
                 special_headers = {'Referer': 'https://www.facebook.com/'}
             
-            # Combine headers
-            headers = {**self.headers, **special_headers}
-            
-            # Make request with timeout
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            # Revalidate an expired cache entry instead of downloading it again
+            validators = self._get_cache_validators(url) if conditional else None
+            if validators:
+                cached, etag, last_modified = validators
+                if etag:
+                    special_headers['If-None-Match'] = etag
+                if last_modified:
+                    special_headers['If-Modified-Since'] = last_modified
+            
+            # Make request with timeout (the session supplies the common headers)
+            response = self._session.get(url, headers=special_headers, timeout=self.timeout, stream=True)
+            fetch['status'] = response.status_code
+            try:
+                if response.status_code == 304 and validators:
+                    logger.info("Cached content still current for %s", url)
+                    return {**cached, 'etag': etag, 'last_modified': last_modified}
+                
+                if response.status_code != 200:
+                    logger.warning(f"Failed to fetch {url}: HTTP {response.status_code}")
+                    return None
+                
+                page = self._read_html(response)
+                fetch['page'] = page
+            finally:
+                response.close()
             
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch {url}: HTTP {response.status_code}")
+            if page is None:
                 return None
+            body, charset = page
+            
+            # Validators let a later refetch be a conditional request
+            response_validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
             
             # Check for paywalls or subscription notices
-            content_lower = response.text.lower()
-            paywall_indicators = ['subscribe now', 'subscription required', 'premium content', 
-                                'to continue reading', 'create an account', 'sign up to read',
-                                'subscribe to read', 'premium subscriber', 'to continue reading']
+            has_paywall = self._PAYWALL_RE.search(body) is not None
             
-            has_paywall = any(indicator in content_lower for indicator in paywall_indicators)
+            # Create a BeautifulSoup object
+            soup = self._make_soup(body, charset)
             
-            # Extract the title
-            title = self._extract_title_from_html(response.text)
+            # Extract the title, decoded like the page (the parser also honours <meta charset>)
+            title = self._extract_title_from_html(body, soup.original_encoding or charset)
             
-            # Create a BeautifulSoup object
-            soup = BeautifulSoup(response.text, self.parser)
+            content = ""
             
             # First try site-specific extractor
             site_extractor = self._get_site_specific_extractor(domain)
             if site_extractor:
-                content = site_extractor(soup)
-                if content and len(content) > 200:
-                    return {
-                        'title': title,
-                        'content': content,
-                        'html': None  # Don't store HTML to save memory
-                    }
-            
-            # If site-specific extractor failed or if content might be behind paywall
-            if has_paywall and (not content or len(content) < 500):
+                content = site_extractor(soup) or ""
+            
+            # If site-specific extractor failed and the content might be behind a paywall
+            if has_paywall and len(content) <= 200:
                 return {
                     'title': title,
                     'content': "Article behind paywall",
                     'html': None
                 }
-                
-            # Try multiple extraction methods
-            content = self.extract_from_multiple_selectors(soup)
             
-            if content and len(content) > 200:
-                return {
-                    'title': title,
-                    'content': content,
-                    'html': None  # Don't store HTML to save memory
-                }
+            # Each fallback runs only while nothing usable has been extracted,
+            # so a good early result doesn't pay for further tree walks
+            
+            # Try multiple extraction methods
+            if len(content) <= 200:
+                content = self.extract_from_multiple_selectors(soup) or ""
             
             # If we couldn't extract content, try a different approach
-            content = self._extract_paragraphs(soup)
+            if len(content) <= 200:
+                content = self._extract_paragraphs(soup) or ""
             
-            if content and len(content) > 200:
-                return {
-                    'title': title,
-                    'content': content,
-                    'html': None
-                }
-                
             # If still no content, use a more aggressive approach
-            content = self._extract_text_content(soup)
+            if len(content) <= 200:
+                content = self._extract_text_content(soup) or ""
             
-            if content and len(content) > 200:
+            if len(content) > 200:
                 return {
                     'title': title,
                     'content': content,
-                    'html': None
+                    'html': None,  # Don't store HTML to save memory
+                    **response_validators
                 }
                 
             # If we reach here, extraction failed
@@ -717,18 +1014,70 @@ class ContentScraper:
                 'html': None
             }
     
-    def _extract_title_from_html(self, html_text):
-        """Extract the title from HTML (optimized)"""
+    def _read_html(self, response):
+        """
+        Read a streamed response body, up to _MAX_BODY_BYTES
+        Returns (raw bytes, charset from the Content-Type header or None),
+        or None if the response is not an HTML page
+        """
+        content_type = response.headers.get('Content-Type', '').lower()
+        if content_type and 'html' not in content_type and 'xml' not in content_type:
+            logger.warning(f"Skipping non-HTML response ({content_type}) from {response.url}")
+            return None
+        
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= self._MAX_BODY_BYTES:
+                logger.info("Truncated response from %s at %d bytes", response.url, total)
+                break
+        
+        charset_match = _CHARSET_RE.search(content_type)
+        return b"".join(chunks), charset_match.group(1) if charset_match else None
+    
+    def _make_soup(self, body, charset=None):
+        """
+        Parse the <body> of a page from its raw bytes (the parser decodes them)
+        
+        The title is read separately, so <head> with its scripts, styles and
+        metadata is skipped; pages without a recognisable body are parsed whole.
+        Non-text subtrees are dropped once here so later text walks skip them.
+        """
+        soup = BeautifulSoup(body, self.parser, parse_only=_BODY_STRAINER, from_encoding=charset)
+        if not soup.contents:
+            soup = BeautifulSoup(body, self.parser, from_encoding=charset)
+        
+        for element in soup(self._NON_TEXT_TAGS):
+            element.decompose()
+        return soup
+    
+    def _extract_title_from_html(self, body, charset=None):
+        """
+        Extract the title from the raw bytes of an HTML page (optimized)
+        charset should be the page's detected encoding (soup.original_encoding)
+        """
         try:
-            # Try to extract title using regex first (faster)
-            title_match = re.search('<title[^>]*>(.*?)</title>', html_text, re.IGNORECASE)
+            # Try to extract title using regex first (faster); the title is
+            # almost always in the first few KB, so scan the whole page only
+            # when it is not there
+            title_match = _TITLE_RE.search(body, 0, self._TITLE_SCAN_BYTES) or _TITLE_RE.search(body)
             if title_match:
-                return title_match.group(1)
-            
-            # If regex fails, use BeautifulSoup
-            soup = BeautifulSoup(html_text, self.parser)
+                raw_title = title_match.group(1)
+                try:
+                    return raw_title.decode(charset or 'utf-8', errors='replace')
+                except LookupError:
+                    # Unknown charset name in the page or its headers
+                    return raw_title.decode('utf-8', errors='replace')
+            
+            # If regex fails, use BeautifulSoup on just the <head>, where
+            # <title> and the og: meta tags live
+            head_end = _HEAD_END_RE.search(body)
+            head = body[:head_end.end()] if head_end else body[:self._HEAD_FALLBACK_BYTES]
+            soup = BeautifulSoup(head, self.parser, from_encoding=charset)
             if soup.title:
-                return soup.title.get_text().strip()
+                return soup.title.get_text(strip=True)
                 
             # Try meta tags
             meta_title = soup.find("meta", property="og:title")
@@ -736,56 +1085,29 @@ class ContentScraper:
                 return meta_title["content"].strip()
                 
             return "Unknown Title"
-        except:
+        except Exception as e:
+            logger.debug("Title extraction failed: %s", e)
             return "Unknown Title"
     
-    def _extract_article_content(self, soup):
-        """Extract article content using common article containers"""
-        # Try to find main content containers
-        for selector in ['article', '[itemprop="articleBody"]', '.article-content', 
-                        '.article-body', '.story-body', '.post-content', '.content',
-                        '#content', '.main-content', '.entry-content']:
-            try:
-                element = soup.select_one(selector)
-                if element:
-                    # First try to get all paragraphs within this container
-                    paragraphs = element.find_all('p')
-                    if paragraphs:
-                        content = "\n\n".join([p.get_text().strip() for p in paragraphs 
-                                            if len(p.get_text().strip()) > 20])
-                        if len(content) > 200:
-                            return content
-                    
-                    # If no paragraphs or content too short, get all text
-                    content = element.get_text().strip()
-                    if len(content) > 200:
-                        # Clean up content (remove extra whitespace)
-                        content = re.sub(r'\s+', ' ', content)
-                        content = re.sub(r'\n\s*\n', '\n\n', content)
-                        return content
-            except:
-                continue
-        
-        return ""
-    
     def _extract_paragraphs(self, soup):
         """Extract all paragraphs from the page"""
         try:
-            paragraphs = soup.find_all('p')
+            # Drop navigation chrome once instead of checking every paragraph's ancestors
+            # (the later fallbacks strip these elements too)
+            for element in soup(['nav', 'header', 'footer', 'aside']):
+                element.decompose()
             
-            # Filter out short paragraphs and navigation elements
+            # Filter out short paragraphs
             filtered_paragraphs = []
-            for p in paragraphs:
+            for p in soup.find_all('p'):
                 text = p.get_text().strip()
                 if len(text) > 20:
-                    # Check if not in a nav, header, or footer element
-                    if not any(parent.name in ['nav', 'header', 'footer'] 
-                              for parent in p.parents):
-                        filtered_paragraphs.append(text)
+                    filtered_paragraphs.append(text)
             
             content = "\n\n".join(filtered_paragraphs)
             return content if len(content) > 200 else ""
-        except:
+        except Exception as e:
+            logger.debug("Paragraph extraction failed: %s", e)
             return ""
     
     def _extract_text_content(self, soup):
@@ -795,14 +1117,14 @@ class ContentScraper:
             for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
                 element.decompose()
             
-            # Get text and split into lines
+            # Get text and walk its lines without building a list of them
             text = soup.get_text(separator='\n')
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
             
             # Filter out short lines and remove duplicate/similar lines
             filtered_lines = []
             seen_lines = set()
-            for line in lines:
+            for match in _LINE_RE.finditer(text):
+                line = match.group().strip()
                 if len(line) > 30:
                     # Simple deduplication - check first 10 chars to avoid similar headers/dates
                     line_start = line[:10].lower()
@@ -812,47 +1134,73 @@ class ContentScraper:
             
             content = "\n\n".join(filtered_lines)
             return content
-        except:
+        except Exception as e:
+            logger.debug("Text extraction failed: %s", e)
             return ""
     
-    def get_article_content(self, url):
-        """Get the content of an article with enhanced fallbacks"""
+    def get_article_content(self, url, allow_selenium=True, force_rescrape=False):
+        """
+        Get the content of an article with enhanced fallbacks
+        
+        allow_selenium=False skips the Selenium fallback even when it is
+        enabled (used by scrape_articles, which runs it separately).
+        force_rescrape=True ignores the cache and downloads the page again.
+        """
         # Try cached version first
-        cached_content = self._get_cached_content(url)
-        if cached_content:
-            return cached_content
+        if not force_rescrape:
+            cached_content = self._get_cached_content(url)
+            if cached_content:
+                return cached_content
         
-        # Match domain to scraper
         domain = self._extract_domain(url)
-        logger.info(f"Scraping article: {url} from {domain}")
+        logger.info("Scraping article: %s from %s", url, domain)
         
-        # First try with regular requests method
-        content = self._scrape_with_requests(url)
+        use_selenium = self.use_selenium and allow_selenium
+        content = None
         
-        # If content is too short or extraction failed, try the enhanced method
-        if (not content or 
-            content.get('content') == "Failed to extract content" or 
-            content.get('content') == "Article behind paywall" or
-            len(content.get('content', '')) < 300):
-            
-            logger.info(f"Regular extraction failed or content too short, trying enhanced extraction for {url}")
-            enhanced_content = self.scrape_with_enhanced_fallbacks(url)
-            if enhanced_content and len(enhanced_content.get('content', '')) > 300:
-                content = enhanced_content
+        # Skip the requests tiers on domains where only Selenium has worked
+        if use_selenium and self._is_selenium_domain(domain):
+            logger.info("Using Selenium first for %s", url)
+            content = self._selenium_fallback(url)
+            if content:
+                self._record_selenium_hit(domain)
+            else:
+                self._record_selenium_miss(domain)
+                use_selenium = False  # Already tried for this URL
         
-        # Fall back to Selenium only if requests fails AND Selenium is enabled
-        if (not content or 
-            content.get('content') == "Failed to extract content" or 
-            content.get('content') == "Article behind paywall" or
-            len(content.get('content', '')) < 300) and self.use_selenium:
-            
-            logger.info(f"Falling back to Selenium for {url}")
-            try:
-                selenium_content = self._scrape_with_selenium(url)
-                if selenium_content and len(selenium_content.get('content', '')) > 300:
+        if not content:
+            # First try with regular requests method, keeping the downloaded page for reuse
+            fetch = {}
+            content = self._scrape_with_requests(url, conditional=not force_rescrape, fetch=fetch)
+            page = fetch.get('page')
+            
+            # Fetching again can't help after a client error or a non-HTML page
+            status = fetch.get('status')
+            refetch_useless = page is None and status is not None and (400 <= status < 500 or status == 200)
+            
+            # If content is too short or extraction failed, try the enhanced method
+            if (not content or 
+                content.get('content') == "Failed to extract content" or 
+                content.get('content') == "Article behind paywall" or
+                len(content.get('content', '')) < 300) and not refetch_useless:
+                
+                logger.info("Regular extraction failed or content too short, trying enhanced extraction for %s", url)
+                enhanced_content = self.scrape_with_enhanced_fallbacks(url, page=page)
+                if enhanced_content and len(enhanced_content.get('content', '')) > 300:
+                    content = enhanced_content
+            
+            # Fall back to Selenium only if requests fails AND Selenium is enabled
+            # (a browser can't get past a paywall, so those pages are not retried)
+            paywalled = bool(content) and content.get('content') == "Article behind paywall"
+            if (not content or 
+                content.get('content') == "Failed to extract content" or 
+                len(content.get('content', '')) < 300) and use_selenium and not paywalled:
+                
+                logger.info("Falling back to Selenium for %s", url)
+                selenium_content = self._selenium_fallback(url)
+                if selenium_content:
                     content = selenium_content
-            except Exception as e:
-                logger.warning(f"Selenium fallback failed for {url}: {e}")
+                    self._record_selenium_hit(domain)
         
         # Cache the content if we got something
         if content and content.get('content') != "Failed to extract content" and len(content.get('content', '')) > 300:
@@ -861,12 +1209,63 @@ class ContentScraper:
         
         return content  # May be None or error content
         
-    def scrape_article(self, article_data):
+    def _selenium_fallback(self, url):
+        """Scrape with Selenium, returning the result only if it found substantial content"""
+        try:
+            selenium_content = self._scrape_with_selenium(url)
+        except Exception as e:
+            logger.warning(f"Selenium fallback failed for {url}: {e}")
+            return None
+        
+        if selenium_content and len(selenium_content.get('content', '')) > 300:
+            return selenium_content
+        return None
+    
+    def _is_selenium_domain(self, domain):
+        """Whether articles from domain should go to Selenium first"""
+        with self._selenium_domains_lock:
+            return domain in self._selenium_domains
+    
+    def _record_selenium_hit(self, domain):
+        """Remember that only Selenium got content from domain"""
+        with self._selenium_domains_lock:
+            self._selenium_domains[domain] = 0
+            self._store_selenium_domain(domain, 0)
+    
+    def _record_selenium_miss(self, domain):
+        """Count a Selenium-first miss, going back to requests first after too many"""
+        with self._selenium_domains_lock:
+            misses = self._selenium_domains.get(domain, 0) + 1
+            if misses >= self._SELENIUM_FIRST_MAX_MISSES:
+                self._selenium_domains.pop(domain, None)
+                self._store_selenium_domain(domain, None)
+            else:
+                self._selenium_domains[domain] = misses
+                self._store_selenium_domain(domain, misses)
+    
+    def _store_selenium_domain(self, domain, misses):
+        """Persist a Selenium-first domain's miss count (None forgets the domain)"""
+        if self._db is None:
+            return
+        try:
+            with self._cache_lock:
+                if misses is None:
+                    self._db.execute("DELETE FROM selenium_domains WHERE domain = ?", (domain,))
+                else:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO selenium_domains (domain, misses) VALUES (?, ?)",
+                        (domain, misses)
+                    )
+        except Exception as e:
+            logger.error(f"Failed to store Selenium domain: {e}")
+    
+    def scrape_article(self, article_data, allow_selenium=True):
         """
         Scrape content for an article using its URL and title
         
         Parameters:
         - article_data: dict containing at minimum 'url' and 'title', or a string URL
+        - allow_selenium: whether the Selenium fallback may be used for this article
         
         Returns:
         - dict: The updated article data with content added
@@ -894,22 +1293,16 @@ class ContentScraper:
                 else:
                     url = 'https://www.' + url
                 article_data['url'] = url
-                logger.info(f"Fixed URL format: {url}")
+                logger.info("Fixed URL format: %s", url)
             
             # Try to get content from the URL
-            content_result = self.get_article_content(url)
+            content_result = self.get_article_content(url, allow_selenium=allow_selenium)
             
             if content_result:
-                # Update the article with the scraped content
+                # Update the article with the scraped content (get_article_content has
+                # already run the enhanced fallback on the downloaded page if it was short)
                 article_data['content'] = content_result.get('content', '')
                 
-                # Check if content is substantial
-                if len(article_data['content']) < 300 and article_data['content'] != "Article behind paywall":
-                    # Try one more aggressive attempt
-                    enhanced_result = self.scrape_with_enhanced_fallbacks(url)
-                    if enhanced_result and len(enhanced_result.get('content', '')) > 300:
-                        article_data['content'] = enhanced_result.get('content', '')
-                
                 # If the article didn't have a title, use the one from content
                 if not article_data.get('title') and content_result.get('title'):
                     article_data['title'] = content_result.get('title')
@@ -941,6 +1334,70 @@ class ContentScraper:
                 }
             return article_data
     
+    def scrape_articles(self, article_data_list, max_workers=8):
+        """
+        Scrape content for several articles concurrently
+        
+        Parameters:
+        - article_data_list: list of article dicts or string URLs, as accepted by scrape_article
+        - max_workers: maximum number of articles fetched at the same time
+        
+        Returns:
+        - list: The updated article data, in the same order as the input
+        """
+        if not article_data_list:
+            return []
+        
+        # Articles from domains where only Selenium has worked skip the
+        # threaded requests tiers and go to the serial Selenium pass
+        selenium_first = set()
+        if self.use_selenium:
+            for i, article_data in enumerate(article_data_list):
+                url = article_data if isinstance(article_data, str) else article_data.get('url')
+                if url and self._is_selenium_domain(self._extract_domain(url)):
+                    selenium_first.add(i)
+        threaded = [i for i in range(len(article_data_list)) if i not in selenium_first]
+        results = [None] * len(article_data_list)
+        
+        # Plain HTTP fetches spend most of their time waiting on the network,
+        # so run them side by side
+        if threaded:
+            workers = min(max_workers, len(threaded))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                scraped = executor.map(
+                    lambda i: self.scrape_article(article_data_list[i], allow_selenium=False),
+                    threaded
+                )
+                for i, article_data in zip(threaded, scraped):
+                    results[i] = article_data
+        
+        # The WebDriver is not thread-safe, so everything Selenium does runs
+        # one article at a time from here on. Selenium-first articles still
+        # check the cache first and fall back to the requests tiers.
+        for i in sorted(selenium_first):
+            results[i] = self.scrape_article(article_data_list[i])
+        
+        # Only the threaded articles that failed go through Selenium
+        if self.use_selenium:
+            for i in threaded:
+                article_data = results[i]
+                if (article_data.get('scraping_success') or not article_data.get('url') or
+                        article_data.get('content') == "Article behind paywall"):
+                    continue
+                
+                url = article_data['url']
+                logger.info("Falling back to Selenium for %s", url)
+                selenium_content = self._selenium_fallback(url)
+                if selenium_content:
+                    self._record_selenium_hit(self._extract_domain(url))
+                    self._cache_content(url, selenium_content)
+                    article_data['content'] = selenium_content['content']
+                    if not article_data.get('title') and selenium_content.get('title'):
+                        article_data['title'] = selenium_content['title']
+                    article_data['scraping_success'] = True
+        
+        return results
+    
     def generate_simple_content(self, title, url):
         """Generate a simple content object when all scraping methods fail"""
         return {
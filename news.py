@@ -20,6 +20,7 @@ import logging
 import time
 import re
 import io
+import functools
 from datetime import datetime
 
 # Configure logging
@@ -28,7 +29,9 @@ logger = logging.getLogger(__name__)
 
 # Environment configuration
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
-os.environ["CUDA_VISIBLE_DEVICES"] = ""
+# GPUs stay hidden unless CUDA_VISIBLE_DEVICES is already set or
+# NEWSAGENT_CUDA names the devices to use (e.g. NEWSAGENT_CUDA=0)
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", os.environ.get("NEWSAGENT_CUDA", ""))
 os.environ["PYTHONWARNINGS"] = "ignore"
 
 # Debug flag to help troubleshoot issues
@@ -37,8 +40,28 @@ DEBUG_MODE = True
 # Fixed number of articles to select from slider - updated with more options and higher default
 ARTICLE_CHOICES = [5, 10, 15, 20, 25, 30]
 
+# Patterns used on every article's text, compiled once
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\n|\r\n\r\n')
+
+# Placeholder/error text left behind by failed extractions, as one alternation
+_PLACEHOLDER_RE = re.compile('|'.join([
+    r'this content (is|was) (not|no longer) available',
+    r'please subscribe to continue reading',
+    r'sign in to read (more|full article)',
+    r'access to this (resource|content|page) (is|has been) (denied|restricted)',
+    r'(error|unable) (loading|retrieving) content',
+    r'javascript (is|must be) (required|enabled)',
+    r'connection (error|issue|problem)'
+]), re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1024)
 def get_sentiment(text):
-    """Perform sentiment analysis using TextBlob with error handling"""
+    """
+    Perform sentiment analysis using TextBlob with error handling
+    Results are memoized since every rerun re-scores the same summaries
+    """
     try:
         analysis = TextBlob(text)
         pol = analysis.polarity
@@ -62,9 +85,9 @@ def clean_html_text(text):
         return ""
     
     # First try with regex (faster)
-    clean_text = re.sub(r'<[^>]+>', ' ', text)
+    clean_text = _HTML_TAG_RE.sub(' ', text)
     # Replace multiple spaces with a single space
-    clean_text = re.sub(r'\s+', ' ', clean_text)
+    clean_text = _WHITESPACE_RE.sub(' ', clean_text)
     # Replace HTML entities
     clean_text = clean_text.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')\
                           .replace('&quot;', '"').replace('&#39;', "'")
@@ -80,7 +103,7 @@ def verify_content_quality(content):
         return False, "Content is too short"
     
     # Check if content is mostly HTML
-    html_tags_count = len(re.findall(r'<[^>]+>', content))
+    html_tags_count = len(_HTML_TAG_RE.findall(content))
     if html_tags_count > 20:
         return False, "Content contains too many HTML tags"
     
@@ -93,24 +116,12 @@ def verify_content_quality(content):
         if len(unique_chunks) < len(chunks) * 0.7:  # More than 30% repetition
             return False, "Content has too much repetitive text"
     
-    # Check for placeholder/error text
-    placeholder_patterns = [
-        r'this content (is|was) (not|no longer) available',
-        r'please subscribe to continue reading',
-        r'sign in to read (more|full article)',
-        r'access to this (resource|content|page) (is|has been) (denied|restricted)',
-        r'(error|unable) (loading|retrieving) content',
-        r'javascript (is|must be) (required|enabled)',
-        r'connection (error|issue|problem)'
-    ]
-    
-    content_lower = content.lower()
-    for pattern in placeholder_patterns:
-        if re.search(pattern, content_lower):
-            return False, "Content contains error or placeholder text"
+    # Check for placeholder/error text (one scan for all patterns)
+    if _PLACEHOLDER_RE.search(content):
+        return False, "Content contains error or placeholder text"
     
     # Check for reasonable paragraph structure
-    paragraphs = re.split(r'\n\n|\r\n\r\n', content)
+    paragraphs = _PARAGRAPH_SPLIT_RE.split(content)
     if len(paragraphs) < 2:
         # Try another split method
         paragraphs = content.split('. ')
@@ -329,6 +340,10 @@ def process_search(news_fetcher, content_scraper, summary_gen, topic_extractor,
             paywall_count = 0
             failure_count = 0
             
+            # Articles are scraped concurrently in batches ahead of processing
+            scraped_articles = {}
+            scrape_batch_size = max(num_articles, 5)
+            
             for idx, article in enumerate(articles):
                 url = article.get('url', '')
                 title = article.get('title', 'Untitled')
@@ -350,8 +365,12 @@ def process_search(news_fetcher, content_scraper, summary_gen, topic_extractor,
                         article['url'] = url
                         debug_print(f"Fixed URL: {url}")
                     
-                    # Scrape content for this article
-                    processed_article = content_scraper.scrape_article(article)
+                    # Scrape content for the next batch of articles if needed
+                    if idx not in scraped_articles:
+                        batch = articles[idx:idx + scrape_batch_size]
+                        for offset, scraped in enumerate(content_scraper.scrape_articles(batch)):
+                            scraped_articles[idx + offset] = scraped
+                    processed_article = scraped_articles.pop(idx)
                     
                     # Check content length
                     content = processed_article.get('content', '')
@@ -451,10 +470,6 @@ def process_search(news_fetcher, content_scraper, summary_gen, topic_extractor,
                         
                     processed_articles.append(processed_article)
                     
-                    # Save cache occasionally
-                    if idx % 5 == 0:
-                        content_scraper._save_cache()
-                    
                     # If we have enough successful articles, we can stop processing
                     if success_count >= num_articles and idx >= num_articles:
                         debug_print(f"Reached target of {num_articles} successful articles, stopping processing")
@@ -977,15 +992,14 @@ def main():
             st.markdown(f"- Topic Extractor: {'✅ Operational' if topic_extractor else '❌ Failed'}")
             st.markdown(f"- Comparative Analyzer: {'✅ Operational' if comparative_analyzer else '❌ Failed'}")
             st.markdown(f"- TTS Service: {'✅ Enabled' if st.session_state.enable_tts else '❌ Disabled'}")
-            st.markdown(f"- Cache: {'✅ Loaded' if hasattr(content_scraper, 'cache') and content_scraper.cache else '⚠️ Empty'}")
+            st.markdown(f"- Cache: {'✅ Loaded' if content_scraper and content_scraper.cache_size() else '⚠️ Empty'}")
             st.markdown(f"- Current Time (UTC): {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
             st.markdown(f"- Current User: grittyuser007")
             
             if DEBUG_MODE:
                 st.markdown("- **Debug Mode: ENABLED**")
                 if st.button("Clear Cache"):
-                    content_scraper.cache = {}
-                    content_scraper._save_cache()
+                    content_scraper.clear_cache()
                     st.success("Cache cleared")
                 
                 col1, col2 = st.columns(2)
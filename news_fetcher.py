@@ -6,7 +6,9 @@ import re
 import time
 import random
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus, urlparse
 
 # Configure logging
@@ -19,6 +21,7 @@ class NewsFetcher:
         """Initialize the news fetcher with optimized defaults"""
         self.use_google = use_google
         self.timeout = 8  # Reduced timeout
+        self.max_link_workers = 8  # Google News redirects resolved at the same time
         
         # Common headers to simulate a real browser
         self.headers = {
@@ -28,6 +31,14 @@ class NewsFetcher:
             'Connection': 'keep-alive',
         }
         
+        # One session for all requests, so connections to Google, Bing and
+        # the news sites are reused instead of re-established each time
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+        
         # Google News base URL
         self.google_news_url = "https://news.google.com/search?q="
         
@@ -68,16 +79,36 @@ class NewsFetcher:
             'medium.com',
             'techcrunch.com'
         ]
+        
+        # domain -> (is_preferred, is_difficult), filled in by _classify_domain
+        self._domain_classes = {}
+    
+    def close(self):
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def _classify_domain(self, url):
+        """
+        Return (is_preferred, is_difficult) for a URL's domain
+        Results are memoized per domain, since results and sorting check the same few sites repeatedly
+        """
+        domain = urlparse(url).netloc.lower()
+        classification = self._domain_classes.get(domain)
+        if classification is None:
+            classification = (
+                any(preferred in domain for preferred in self.preferred_domains),
+                any(difficult in domain for difficult in self.difficult_domains)
+            )
+            self._domain_classes[domain] = classification
+        return classification
     
     def is_preferred_domain(self, url):
         """Check if URL belongs to a preferred (easily scrapable) domain"""
-        domain = urlparse(url).netloc.lower()
-        return any(preferred in domain for preferred in self.preferred_domains)
+        return self._classify_domain(url)[0]
     
     def is_difficult_domain(self, url):
         """Check if URL belongs to a difficult to scrape domain"""
-        domain = urlparse(url).netloc.lower()
-        return any(difficult in domain for difficult in self.difficult_domains)
+        return self._classify_domain(url)[1]
     
     def get_news_links(self, query, max_articles=5, max_attempts=3, min_preferred=3):
         """
@@ -166,14 +197,14 @@ class NewsFetcher:
         # Follow Google redirect to get the actual news URL
         if 'news.google.com/articles' in link:
             try:
-                response = requests.head(link, headers=self.headers, allow_redirects=True, timeout=5)
+                response = self.session.head(link, allow_redirects=True, timeout=5)
                 if response.url and 'news.google.com' not in response.url:
                     # Verify the URL is properly formed
                     if not response.url.startswith(('http://', 'https://')):
                         return None
                     return response.url
-            except:
-                pass
+            except requests.RequestException as e:
+                logger.debug(f"Could not resolve Google News link {link}: {e}")
                 
         return link
     
@@ -202,7 +233,7 @@ class NewsFetcher:
             
             # Make the request to Google News
             url = f"{self.google_news_url}{encoded_query}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch news from Google: {response.status_code}")
@@ -216,6 +247,8 @@ class NewsFetcher:
             # Find article sections
             article_sections = re.findall(r'<article[^>]*>(.*?)</article>', response.text, re.DOTALL)
             
+            # Parse the candidates first; their links are resolved afterwards, together
+            candidates = []
             for section in article_sections[:max_articles * 2]:  # Get more than needed in case some fail
                 try:
                     # Extract title
@@ -224,16 +257,13 @@ class NewsFetcher:
                         continue
                     title = title_match.group(1).strip()
                     title = re.sub(r'<[^>]*>', '', title)  # Remove any HTML tags
+                    if len(title) <= 10:
+                        continue
                     
                     # Extract URL
                     url_match = re.search(r'<a[^>]*href="([^"]*)"', section)
                     if not url_match:
                         continue
-                    url = self._clean_link(url_match.group(1))
-                    
-                    # Skip if URL cleaning failed
-                    if not url or not url.startswith(('http://', 'https://')):
-                        continue
                     
                     # Extract source
                     source_match = re.search(r'<div[^>]*data-n-tid="9"[^>]*>(.*?)</div>', section, re.DOTALL)
@@ -254,10 +284,31 @@ class NewsFetcher:
                             if timestamp_text[0].isdigit():
                                 days = int(timestamp_text[0])
                             # Calculate days ago
-                            from datetime import datetime, timedelta
                             timestamp = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
                     
-                    if url and title and len(title) > 10:
+                    candidates.append((title, url_match.group(1), source, timestamp))
+                except Exception as e:
+                    logger.error(f"Error parsing Google News article: {e}")
+                    continue
+            
+            if not candidates:
+                return []
+            
+            # Each Google link takes a redirect round-trip to resolve, so follow
+            # them side by side, but only as many at a time as articles are
+            # still needed (in order, stopping once there are enough)
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_link_workers, max_articles))) as executor:
+                start = 0
+                while start < len(candidates) and len(articles) < max_articles:
+                    batch = candidates[start:start + max_articles - len(articles)]
+                    start += len(batch)
+                    urls = executor.map(self._clean_link, [link for _, link, _, _ in batch])
+                    
+                    for (title, _, source, timestamp), url in zip(batch, urls):
+                        # Skip if URL cleaning failed
+                        if not url or not url.startswith(('http://', 'https://')):
+                            continue
+                        
                         articles.append({
                             'title': title,
                             'url': url,
@@ -266,12 +317,6 @@ class NewsFetcher:
                             'article_id': f"gn_{hash(url) % 100000}",
                             'is_preferred': self.is_preferred_domain(url)
                         })
-                        
-                        if len(articles) >= max_articles:
-                            break
-                except Exception as e:
-                    logger.error(f"Error parsing Google News article: {e}")
-                    continue
             
             return articles
             
@@ -296,7 +341,7 @@ class NewsFetcher:
             
             # Make the request to Bing News
             url = f"{self.bing_news_url}{encoded_query}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch news from Bing: {response.status_code}")
@@ -380,7 +425,7 @@ class NewsFetcher:
                 return False
                 
             # Make a quick HEAD request first
-            head_response = requests.head(url, headers=self.headers, timeout=3)
+            head_response = self.session.head(url, timeout=3)
             
             # Check content type
             content_type = head_response.headers.get('Content-Type', '')
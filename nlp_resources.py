@@ -0,0 +1,49 @@
+"""
+Shared loaders for the NLP models used across News Analyzer
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# NLTK resources and where they live once installed
+NLTK_RESOURCES = [('punkt', 'tokenizers/punkt'), ('stopwords', 'corpora/stopwords')]
+
+def ensure_nltk_resources():
+    """Download NLTK resources only if they are not installed yet"""
+    import nltk
+    for resource, path in NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            logger.info(f"Downloading NLTK resource: {resource}")
+            nltk.download(resource, quiet=True)
+
+# spaCy components not needed for named entities (NER runs on tok2vec + ner alone)
+SPACY_NER_EXCLUDE = ["parser", "tagger", "attribute_ruler", "lemmatizer"]
+
+# spaCy pipelines already loaded in this process, keyed by (model name, excluded components)
+_SPACY_PIPELINES = {}
+
+def load_spacy_model(name="en_core_web_sm", exclude=()):
+    """
+    Load a spaCy model once per process and reuse it afterwards
+
+    Parameters:
+    - name: spaCy model package name (downloaded if not installed)
+    - exclude: pipeline components the caller does not need
+
+    Returns:
+    - The loaded spaCy Language pipeline
+    """
+    key = (name, tuple(sorted(exclude)))
+    if key not in _SPACY_PIPELINES:
+        import spacy
+        try:
+            _SPACY_PIPELINES[key] = spacy.load(name, exclude=list(exclude))
+        except OSError:
+            # Download the model if not available
+            logger.info("Downloading spaCy model...")
+            import spacy.cli
+            spacy.cli.download(name)
+            _SPACY_PIPELINES[key] = spacy.load(name, exclude=list(exclude))
+    return _SPACY_PIPELINES[key]
@@ -6,15 +6,15 @@ import nltk
 from nltk.tokenize import sent_tokenize
 from nltk.corpus import stopwords
 import logging
+from nlp_resources import ensure_nltk_resources
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Download required NLTK resources silently
+# Download required NLTK resources silently, skipping ones already installed
 try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
+    ensure_nltk_resources()
 except Exception as e:
     logger.error(f"Failed to download NLTK resources: {e}")
 
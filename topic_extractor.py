@@ -2,10 +2,10 @@
 Topic extraction module for News Analyzer
 """
 import yake
-import spacy
 from collections import Counter
 from sklearn.feature_extraction.text import CountVectorizer
 from keybert import KeyBERT
+from nlp_resources import load_spacy_model, SPACY_NER_EXCLUDE
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,13 +32,8 @@ class TopicExtractor:
             
             # Load models that require more resources only if specified
             if use_spacy:
-                try:
-                    self.nlp = spacy.load("en_core_web_sm")
-                except OSError:
-                    # Download the model if not available
-                    logger.info("Downloading spaCy model...")
-                    spacy.cli.download("en_core_web_sm")
-                    self.nlp = spacy.load("en_core_web_sm")
+                # Loaded once per process and shared with ComparativeAnalyzer (same exclude list)
+                self.nlp = load_spacy_model("en_core_web_sm", exclude=SPACY_NER_EXCLUDE)
             
             if use_keybert:
                 self.keybert_model = KeyBERT()